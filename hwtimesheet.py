@@ -1,6 +1,7 @@
 from taipy.gui import Gui, notify
 from datetime import datetime, date, timedelta
 import sqlite3
+import os
 import pandas as pd
 
 # ---- Pay Period Configuration (FIXED - Biweekly 14-day periods) ----
@@ -59,10 +60,46 @@ def get_current_and_previous_periods():
     return current_period, previous_period
 
 # ---- Database functions ----
+# taipy_timesheet.py migrates timesheet.db to a compact schema this app cannot read, one-way,
+# so this app keeps the original TEXT schema in its own file, seeded from timesheet.db on first run.
+DB_PATH = "hwtimesheet.db"
+SHARED_DB_PATH = "timesheet.db"
+
+def seed_from_shared_db():
+    """Copy the shared timesheet.db into DB_PATH on first run if it still has the TEXT schema"""
+    if os.path.exists(DB_PATH) or not os.path.exists(SHARED_DB_PATH):
+        return
+    
+    src = sqlite3.connect(SHARED_DB_PATH)
+    try:
+        columns = [col[1] for col in src.execute("PRAGMA table_info(shifts)").fetchall()]
+        if not columns:
+            return
+        if 'per_diem' not in columns:
+            print("!" * 70)
+            print(f"WARNING: {SHARED_DB_PATH} was already converted by taipy_timesheet.py and")
+            print(f"cannot be read by this app. Starting with an empty {DB_PATH}; the saved")
+            print(f"shifts are still available in taipy_timesheet.py.")
+            print("!" * 70)
+            return
+        
+        # Copy to a temporary file first so a failed copy is retried on the next run
+        tmp_path = DB_PATH + ".tmp"
+        dst = sqlite3.connect(tmp_path)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+        os.replace(tmp_path, DB_PATH)
+        print(f"Copied existing shifts from {SHARED_DB_PATH} into {DB_PATH}")
+    finally:
+        src.close()
+
 def check_database_structure():
     """Check and fix database structure"""
     try:
-        conn = sqlite3.connect("timesheet.db")
+        seed_from_shared_db()
+        conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='shifts'")
@@ -106,7 +143,7 @@ def check_database_structure():
 def get_saved_shifts():
     """Get saved shifts with Edit and Delete action buttons"""
     try:
-        conn = sqlite3.connect("timesheet.db")
+        conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute("PRAGMA table_info(shifts)")
         columns = cursor.fetchall()
@@ -151,7 +188,7 @@ def get_saved_shifts():
 def save_shift_to_db(shift_date, start_time, end_time, per_diem, site_bonus):
     """Save shift to database"""
     try:
-        conn = sqlite3.connect("timesheet.db")
+        conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute("""
             INSERT INTO shifts (date, start_time, end_time, per_diem, site_bonus) 
@@ -167,7 +204,7 @@ def save_shift_to_db(shift_date, start_time, end_time, per_diem, site_bonus):
 def update_shift_in_db(shift_id, shift_date, start_time, end_time, per_diem, site_bonus):
     """Update existing shift in database"""
     try:
-        conn = sqlite3.connect("timesheet.db")
+        conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute("""
             UPDATE shifts 
@@ -185,7 +222,7 @@ def update_shift_in_db(shift_id, shift_date, start_time, end_time, per_diem, sit
 def get_shift_by_id(shift_id):
     """Get a specific shift by ID for editing"""
     try:
-        conn = sqlite3.connect("timesheet.db")
+        conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute("""
             SELECT id, date, start_time, end_time, per_diem, site_bonus
@@ -211,7 +248,7 @@ def get_shift_by_id(shift_id):
 def delete_shift_from_db(shift_id):
     """Delete a shift from the database by ID"""
     try:
-        conn = sqlite3.connect("timesheet.db")
+        conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute("DELETE FROM shifts WHERE id = ?", (shift_id,))
         conn.commit()
@@ -225,7 +262,7 @@ def delete_shift_from_db(shift_id):
 def delete_all_shifts():
     """Delete all shifts from database"""
     try:
-        conn = sqlite3.connect("timesheet.db")
+        conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute("DELETE FROM shifts")
         conn.commit()
@@ -310,7 +347,7 @@ def calculate_hours_from_timesheet(start_time, end_time):
 def analyze_timesheet_by_periods():
     """Analyze timesheet data by defined pay periods with weekly overtime calculation"""
     try:
-        conn = sqlite3.connect("timesheet.db")
+        conn = sqlite3.connect(DB_PATH)
         
         query = """
             SELECT date, start_time, end_time, per_diem, site_bonus, created_at
@@ -849,4 +886,5 @@ if __name__ == "__main__":
     
     print("Starting GUI...")
     gui = Gui(pages=pages)
-    gui.run(title="Biweekly Timesheet Calculator", port=5000, debug=True, on_init=on_init)
+    gui.run(title="Biweekly Timesheet Calculator", port=5000,
+            debug=bool(os.environ.get("TIMESHEET_DEBUG")), on_init=on_init)
@@ -1,10 +1,24 @@
 from taipy.gui import Gui, notify
 from datetime import datetime, date, timedelta
+import re
 import sqlite3
+import threading
+import queue
+from concurrent.futures import Future
+import atexit
+import logging
+import os
+import numpy as np
 import pandas as pd
 
+log = logging.getLogger(__name__)
+
+# Debug output is opt-in; warnings and errors still reach stderr without a handler
+if os.environ.get("TIMESHEET_DEBUG"):
+    logging.basicConfig(level=logging.DEBUG)
+
 # ---- Pay Period Configuration (FIXED - Biweekly 14-day periods) ----
-PAY_PERIODS = [
+PAY_PERIODS_RAW = [
     {"start": "2025-08-10", "end": "2025-08-23", "label": "Aug 10-23, 2025"},
     {"start": "2025-08-24", "end": "2025-09-06", "label": "Aug 24 - Sep 6, 2025"},
     {"start": "2025-09-07", "end": "2025-09-20", "label": "Sep 7-20, 2025"},
@@ -17,20 +31,41 @@ PAY_PERIODS = [
     {"start": "2025-12-14", "end": "2025-12-27", "label": "Dec 14-27, 2025"},
 ]
 
+# Parsed once at import so lookups compare date objects directly
+PAY_PERIODS = [
+    {"start": date.fromisoformat(p["start"]), "end": date.fromisoformat(p["end"]), "label": p["label"]}
+    for p in PAY_PERIODS_RAW
+]
+
+# Periods are uniform 14-day windows from the first start date, so a lookup is arithmetic
+PAY_PERIOD_ANCHOR = PAY_PERIODS[0]["start"]
+PAY_PERIOD_DAYS = 14
+_PERIOD_LABELS = {idx: period["label"] for idx, period in enumerate(PAY_PERIODS)}
+
+def _as_date(value):
+    """Normalize a date, datetime or ISO string to a date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
 def get_pay_period_for_date(target_date):
     """Find which pay period a date falls into"""
-    target_dt = pd.to_datetime(str(target_date)).date()
+    target_dt = _as_date(target_date)
     
-    for period in PAY_PERIODS:
-        start_date = pd.to_datetime(period["start"]).date()
-        end_date = pd.to_datetime(period["end"]).date()
-        
-        if start_date <= target_dt <= end_date:
-            return period
+    if target_dt >= PAY_PERIOD_ANCHOR:
+        idx = (target_dt - PAY_PERIOD_ANCHOR).days // PAY_PERIOD_DAYS
+        start = PAY_PERIOD_ANCHOR + timedelta(days=idx * PAY_PERIOD_DAYS)
+        return {
+            "start": start,
+            "end": start + timedelta(days=PAY_PERIOD_DAYS - 1),
+            "label": _PERIOD_LABELS.get(idx, f"Period starting {start}")
+        }
     
     return {
-        "start": str(target_dt),
-        "end": str(target_dt + timedelta(days=13)),  # 14-day periods
+        "start": target_dt,
+        "end": target_dt + timedelta(days=13),  # 14-day periods
         "label": f"Period starting {target_date}"
     }
 
@@ -39,148 +74,430 @@ def get_current_and_previous_periods():
     today = date.today()
     current_period = get_pay_period_for_date(today)
     
-    current_start = pd.to_datetime(current_period["start"]).date()
+    current_start = current_period["start"]
     previous_period = None
     
-    for period in PAY_PERIODS:
-        end_date = pd.to_datetime(period["end"]).date()
-        if end_date < current_start:
-            previous_period = period
+    if current_start > PAY_PERIOD_ANCHOR:
+        previous_period = get_pay_period_for_date(current_start - timedelta(days=1))
     
     if not previous_period:
         prev_end = current_start - timedelta(days=1)
         prev_start = prev_end - timedelta(days=13)  # 14-day periods
         previous_period = {
-            "start": str(prev_start),
-            "end": str(prev_end),
+            "start": prev_start,
+            "end": prev_end,
             "label": f"Previous Period"
         }
     
     return current_period, previous_period
 
+# ---- Per Diem Encoding ----
+# List position is the stored code, so only ever append new options
+PER_DIEM_OPTIONS = ["None", "Breakfast Only", "Breakfast + Lunch", 
+                    "Breakfast + Lunch + Dinner", "Lunch + Dinner", "Dinner Only"]
+
+# shifts.meal_mask packs the per diem code in bits 0-2 and the site bonus flag in bit 3
+PER_DIEM_MASK = 0b0111
+SITE_BONUS_BIT = 0b1000
+PER_DIEM_CODES = {name: code for code, name in enumerate(PER_DIEM_OPTIONS)}
+PER_DIEM_ARR = np.array(PER_DIEM_OPTIONS, dtype=object)
+
+def encode_meal_mask(per_diem, site_bonus):
+    """Pack a per diem choice and site bonus flag into a meal_mask value"""
+    return PER_DIEM_CODES[per_diem] | (SITE_BONUS_BIT if site_bonus else 0)
+
+def decode_meal_mask(codes):
+    """Unpack meal_mask values into per diem names and site bonus flags (vectorized)"""
+    codes = np.asarray(codes, dtype=np.int64)
+    return PER_DIEM_ARR[codes & PER_DIEM_MASK], (codes & SITE_BONUS_BIT) != 0
+
 # ---- Database functions ----
+def _open_conn():
+    """Open a connection to the timesheet database with performance PRAGMAs applied"""
+    conn = sqlite3.connect("timesheet.db", isolation_level=None, check_same_thread=False,
+                           cached_statements=128)
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-20000;
+        PRAGMA mmap_size=268435456;
+        PRAGMA foreign_keys=ON;
+    """)
+    return conn
+
+# Long-lived connections shared across callbacks; Taipy may run callbacks on worker threads.
+# In WAL mode the read-only connection never waits behind a commit on the writer.
+_READ_CONN = None
+_WRITE_CONN = None
+_CONN_OPEN_LOCK = threading.Lock()
+_DB_LOCK = threading.Lock()  # serializes use of the writer connection
+
+def get_read_conn():
+    """Return the shared read-only database connection, opening it on first use"""
+    global _READ_CONN
+    with _CONN_OPEN_LOCK:
+        if _READ_CONN is None:
+            _READ_CONN = _open_conn()
+            _READ_CONN.execute("PRAGMA query_only=true")
+    return _READ_CONN
+
+def get_write_conn():
+    """Return the shared writer connection, opening it on first use (write under _DB_LOCK)"""
+    global _WRITE_CONN
+    with _CONN_OPEN_LOCK:
+        if _WRITE_CONN is None:
+            _WRITE_CONN = _open_conn()
+    return _WRITE_CONN
+
+def _close_conns():
+    """Refresh planner statistics and close the shared connections at interpreter exit"""
+    if _READ_CONN is not None:
+        _READ_CONN.close()
+    if _WRITE_CONN is not None:
+        # The daemon writer thread may still be mid-transaction on this connection
+        with _DB_LOCK:
+            _WRITE_CONN.execute("PRAGMA optimize")
+            _WRITE_CONN.close()
+
+atexit.register(_close_conns)
+
+# schema_version seen after the last successful structure check
+_SCHEMA_CHECKED_VERSION = None
+
+# Dates are stored as proleptic Gregorian ordinals (date.toordinal());
+# julianday(iso) - 1721424.5 converts an ISO date to the same day number in SQL.
+# Times are stored as minutes since midnight. Legacy TEXT tables are migrated one-way,
+# so hwtimesheet.py keeps the old schema in its own file, seeded from this one on first run.
+SHIFTS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date INTEGER NOT NULL,
+        start_time INTEGER NOT NULL,
+        end_time INTEGER NOT NULL,
+        meal_mask INTEGER NOT NULL DEFAULT 0,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+# Builds meal_mask from the legacy per_diem TEXT / site_bonus columns during migration.
+# Only NULL reaches ELSE 0; unknown per_diem text is refused before the rebuild.
+LEGACY_MEAL_MASK_SQL = (
+    "(CASE per_diem "
+    + " ".join(f"WHEN '{name}' THEN {code}" for name, code in PER_DIEM_CODES.items())
+    + f" ELSE 0 END | CASE WHEN site_bonus = 1 THEN {SITE_BONUS_BIT} ELSE 0 END)"
+)
+
+UNKNOWN_PER_DIEM_SQL = (
+    "SELECT DISTINCT per_diem FROM shifts WHERE per_diem NOT IN ("
+    + ", ".join("?" * len(PER_DIEM_OPTIONS)) + ")"
+)
+
+def _legacy_minutes_sql(column):
+    """SQL converting a legacy "HH:MM" TEXT column to minutes since midnight"""
+    return (f"(CAST(substr({column}, 1, instr({column}, ':') - 1) AS INTEGER) * 60"
+            f" + CAST(substr({column}, instr({column}, ':') + 1) AS INTEGER))")
+
+def _legacy_time_valid_sql(column):
+    """SQL true when a legacy TEXT column holds a valid "H:MM"/"HH:MM" time"""
+    return (f"COALESCE(({column} GLOB '[0-9]:[0-9][0-9]' OR {column} GLOB '[0-9][0-9]:[0-9][0-9]')"
+            f" AND CAST(substr({column}, 1, instr({column}, ':') - 1) AS INTEGER) < 24"
+            f" AND CAST(substr({column}, instr({column}, ':') + 1) AS INTEGER) < 60, 0)")
+
+def _rebuild_shifts_table(cursor, select_sql):
+    """Copy shifts into a table with the current schema using select_sql and swap it in"""
+    cursor.execute("BEGIN")
+    try:
+        cursor.execute(SHIFTS_TABLE_SQL.format(name="shifts_new"))
+        cursor.execute(f"""
+            INSERT INTO shifts_new (id, date, start_time, end_time, meal_mask, created_at)
+            {select_sql}
+        """)
+        cursor.execute("DROP TABLE shifts")
+        cursor.execute("ALTER TABLE shifts_new RENAME TO shifts")
+        cursor.execute("COMMIT")
+    except Exception:
+        cursor.execute("ROLLBACK")
+        raise
+
 def check_database_structure():
     """Check and fix database structure"""
+    global _SCHEMA_CHECKED_VERSION
     try:
-        conn = sqlite3.connect("timesheet.db")
+        conn = get_write_conn()
         cursor = conn.cursor()
         
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='shifts'")
-        table_exists = cursor.fetchone()
+        # Nothing changed since the last check, skip the probes
+        schema_version = cursor.execute("PRAGMA schema_version").fetchone()[0]
+        if schema_version == _SCHEMA_CHECKED_VERSION:
+            return True
+        
+        # Autocommit connection: each statement commits unless wrapped in BEGIN/COMMIT
+        with _DB_LOCK:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='shifts'")
+            table_exists = cursor.fetchone()
         
-        if table_exists:
-            cursor.execute("PRAGMA table_info(shifts)")
-            columns = cursor.fetchall()
-            column_names = [col[1] for col in columns]
-            missing_columns = []
+            if table_exists:
+                cursor.execute("PRAGMA table_info(shifts)")
+                columns = cursor.fetchall()
+                column_names = [col[1] for col in columns]
+                column_types = {col[1]: col[2].upper() for col in columns}
+                missing_columns = []
             
-            if 'date' not in column_names:
-                missing_columns.append('date')
-            if 'created_at' not in column_names:
-                missing_columns.append('created_at')
+                if 'date' not in column_names:
+                    missing_columns.append('date')
+                if 'created_at' not in column_names:
+                    missing_columns.append('created_at')
                 
-            if missing_columns:
-                print(f"Missing columns: {missing_columns}")
-                cursor.execute("DROP TABLE shifts")
-                conn.commit()
+                if missing_columns:
+                    log.warning("Missing columns: %s", missing_columns)
+                    cursor.execute("DROP TABLE shifts")
+                else:
+                    # Convert every legacy column in a single rebuild
+                    select_exprs = {
+                        'date': ("CAST(julianday(date) - 1721424.5 AS INTEGER)"
+                                 if column_types['date'] == 'TEXT' else "date"),
+                        'start_time': (_legacy_minutes_sql('start_time')
+                                       if column_types['start_time'] == 'TEXT' else "start_time"),
+                        'end_time': (_legacy_minutes_sql('end_time')
+                                     if column_types['end_time'] == 'TEXT' else "end_time"),
+                        'meal_mask': "meal_mask" if 'meal_mask' in column_names else LEGACY_MEAL_MASK_SQL,
+                    }
+                    if any(expr != name for name, expr in select_exprs.items()):
+                        # One-way: the legacy TEXT columns are dropped, so nothing may be lost
+                        if 'meal_mask' not in column_names:
+                            unknown = [row[0] for row in
+                                       cursor.execute(UNKNOWN_PER_DIEM_SQL, PER_DIEM_OPTIONS)]
+                            if unknown:
+                                log.error("Not migrating shifts, unknown per diem values: %s", unknown)
+                                return False
+                        time_columns = [col for col in ('start_time', 'end_time')
+                                        if column_types[col] == 'TEXT']
+                        if time_columns:
+                            valid = " AND ".join(_legacy_time_valid_sql(col) for col in time_columns)
+                            bad_times = cursor.execute(
+                                f"SELECT id, {', '.join(time_columns)} FROM shifts WHERE NOT ({valid})"
+                            ).fetchall()
+                            if bad_times:
+                                log.error("Not migrating shifts, invalid times (id, times): %s", bad_times)
+                                return False
+                        log.warning("Migrating shifts table to the compact schema")
+                        _rebuild_shifts_table(cursor, f"""
+                            SELECT id, {', '.join(select_exprs.values())}, created_at
+                            FROM shifts
+                        """)
         
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS shifts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            date TEXT NOT NULL,
-            start_time TEXT NOT NULL,
-            end_time TEXT NOT NULL,
-            per_diem TEXT,
-            site_bonus INTEGER DEFAULT 0,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-        conn.commit()
-        conn.close()
+            cursor.execute(SHIFTS_TABLE_SQL.format(name="shifts"))
+            # Superseded by the index below, which also covers the id tie-break
+            cursor.execute("DROP INDEX IF EXISTS idx_shifts_date_created")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_shifts_date_created_id "
+                           "ON shifts(date DESC, created_at DESC, id DESC)")
+            _invalidate_shifts_cache()
+            # May create sqlite_stat1, so run it before recording the schema version
+            cursor.execute("PRAGMA optimize")
+            _SCHEMA_CHECKED_VERSION = cursor.execute("PRAGMA schema_version").fetchone()[0]
         return True
         
     except Exception as e:
-        print(f"Database setup error: {e}")
+        log.error("Database setup error: %s", e)
         return False
 
+SHIFT_COLUMNS = ("id", "date", "start_time", "end_time", "per_diem", "site_bonus")
+# Built once; hand out copies wherever an empty shifts table is needed
+_EMPTY_SHIFTS = pd.DataFrame({col: pd.Series(dtype="object") for col in SHIFT_COLUMNS})
+
+# check_database_structure() guarantees created_at exists, so the ordering is fixed;
+# id breaks same-second created_at ties so newer rows come first, as insert_saved_shift assumes
+SAVED_SHIFTS_SQL = """
+    SELECT id, date(shifts.date + 1721424.5) AS date, start_time, end_time, meal_mask
+    FROM shifts 
+    ORDER BY shifts.date DESC, created_at DESC, id DESC
+"""
+
+# In-memory copy of the saved shifts table, shared by all sessions and dropped on every write.
+# The generation counter lets readers fill it without taking the writer lock.
+_SAVED_SHIFTS_CACHE = None
+_SHIFTS_GENERATION = 0
+
+def _invalidate_shifts_cache():
+    """Forget the cached saved shifts so the next read goes to the database (call under _DB_LOCK)"""
+    global _SAVED_SHIFTS_CACHE, _SHIFTS_GENERATION
+    _SAVED_SHIFTS_CACHE = None
+    _SHIFTS_GENERATION += 1
+
+def _shifts_frame(rows):
+    """Build the display frame from rows selected with SAVED_SHIFTS_SQL"""
+    df = pd.DataFrame.from_records(rows, columns=SHIFT_COLUMNS[:4] + ("meal_mask",))
+    df['start_time'] = format_minutes(df['start_time'])
+    df['end_time'] = format_minutes(df['end_time'])
+    per_diems, site_bonuses = decode_meal_mask(df.pop('meal_mask'))
+    df['per_diem'] = per_diems
+    # Kept boolean so it can be summed directly; the table renders it as a checkbox
+    df['site_bonus'] = site_bonuses
+    return df
+
 def get_saved_shifts():
     """Get saved shifts with ID for deletion"""
+    global _SAVED_SHIFTS_CACHE
     try:
-        conn = sqlite3.connect("timesheet.db")
-        cursor = conn.cursor()
-        cursor.execute("PRAGMA table_info(shifts)")
-        columns = cursor.fetchall()
-        column_names = [col[1] for col in columns]
+        cached = _SAVED_SHIFTS_CACHE
+        if cached is not None:
+            return cached.copy(deep=False)
+        
+        generation = _SHIFTS_GENERATION
+        df = _shifts_frame(get_read_conn().execute(SAVED_SHIFTS_SQL).fetchall())
+        # Only cache if no write landed while we were reading
+        with _DB_LOCK:
+            if generation == _SHIFTS_GENERATION:
+                _SAVED_SHIFTS_CACHE = df
+        log.debug("Loaded %d shifts from database", len(df))
+        return df.copy(deep=False)
         
-        if 'created_at' in column_names:
-            query = """
-                SELECT id, date, start_time, end_time, per_diem, 
-                       CASE WHEN site_bonus = 1 THEN 'Yes' ELSE 'No' END as site_bonus
-                FROM shifts 
-                ORDER BY date DESC, created_at DESC
-            """
-        else:
-            query = """
-                SELECT id, date, start_time, end_time, per_diem, 
-                       CASE WHEN site_bonus = 1 THEN 'Yes' ELSE 'No' END as site_bonus
-                FROM shifts 
-                ORDER BY date DESC, id DESC
-            """
+    except Exception as e:
+        log.error("Error loading shifts: %s", e)
+        return _EMPTY_SHIFTS.copy()
+
+_TIME_RE = re.compile(r"^([0-9]{1,2}):([0-9]{2})$")
+
+def parse_minutes(hhmm):
+    """Parse an "H:MM" or "HH:MM" string into minutes since midnight, raising ValueError if invalid"""
+    match = _TIME_RE.match(hhmm)
+    if not match:
+        raise ValueError(f"Invalid time: {hhmm}")
+    hours, minutes = int(match.group(1)), int(match.group(2))
+    if not (hours < 24 and minutes < 60):
+        raise ValueError(f"Invalid time: {hhmm}")
+    return hours * 60 + minutes
+
+INVALID_TIME_MESSAGE = "❌ Times must be in HH:MM format (00:00-23:59)"
+
+def normalize_shift_times(start_time, end_time):
+    """Validate the shift form's times and return them as "HH:MM", raising ValueError if invalid"""
+    return tuple(f"{minutes // 60:02d}:{minutes % 60:02d}"
+                 for minutes in (parse_minutes(start_time.strip()), parse_minutes(end_time.strip())))
+
+def format_minutes(minutes):
+    """Format a Series of minutes since midnight as "HH:MM" strings (vectorized)"""
+    minutes = minutes.astype(np.int64)
+    return ((minutes // 60).astype(str).str.zfill(2) + ":"
+            + (minutes % 60).astype(str).str.zfill(2))
+
+def _to_ordinal(shift_date):
+    """Convert a day number, date, datetime or ISO string to the day number stored in shifts.date"""
+    if isinstance(shift_date, int):
+        return shift_date
+    if isinstance(shift_date, str):
+        shift_date = date.fromisoformat(shift_date[:10])
+    return shift_date.toordinal()
+
+# Kept as one constant string so the connection's statement cache reuses the compiled INSERT
+INSERT_SQL = "INSERT INTO shifts (date, start_time, end_time, meal_mask) VALUES (?, ?, ?, ?)"
+
+def _insert_rows(params):
+    """Insert encoded shift rows in one transaction, returns their ids"""
+    conn = get_write_conn()
+    with _DB_LOCK:
+        with conn:
+            conn.execute("BEGIN")
+            conn.executemany(INSERT_SQL, params)
+            # AUTOINCREMENT ids are contiguous within one locked transaction
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        # Only after COMMIT, or a reader could cache the pre-commit snapshot
+        _invalidate_shifts_cache()
+    return list(range(last_id - len(params) + 1, last_id + 1))
+
+# Inserts are handed to a single writer thread so saves from concurrent sessions share a commit
+_WRITE_Q = queue.Queue()
+_WRITER = None
+_WRITER_START_LOCK = threading.Lock()
+
+def _writer_loop():
+    """Commit everything queued since the last commit in one transaction (group commit)"""
+    while True:
+        pending = [_WRITE_Q.get()]
+        while True:
+            try:
+                pending.append(_WRITE_Q.get_nowait())
+            except queue.Empty:
+                break
         
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        print(f"Loaded {len(df)} shifts from database")
-        return df
+        try:
+            ids = _insert_rows([row for params, _ in pending for row in params])
+        except Exception:
+            # Retry one request at a time so a bad row only fails its own save
+            for params, future in pending:
+                try:
+                    future.set_result(_insert_rows(params))
+                except Exception as e:
+                    future.set_exception(e)
+            continue
         
+        offset = 0
+        for params, future in pending:
+            future.set_result(ids[offset:offset + len(params)])
+            offset += len(params)
+
+def _start_writer():
+    """Start the background writer thread on first use"""
+    global _WRITER
+    with _WRITER_START_LOCK:
+        if _WRITER is None:
+            _WRITER = threading.Thread(target=_writer_loop, name="timesheet-writer", daemon=True)
+            _WRITER.start()
+
+def save_shifts_batch(rows):
+    """Save many shifts in a single transaction, returns the ids of the inserted rows"""
+    try:
+        params = [(_to_ordinal(shift_date), parse_minutes(start_time), parse_minutes(end_time),
+                   encode_meal_mask(per_diem, site_bonus))
+                  for shift_date, start_time, end_time, per_diem, site_bonus in rows]
+        if not params:
+            return []
+        _start_writer()
+        future = Future()
+        _WRITE_Q.put((params, future))
+        return future.result()
     except Exception as e:
-        print(f"Error loading shifts: {e}")
-        return pd.DataFrame({
-            'id': [], 'date': [], 'start_time': [], 'end_time': [], 
-            'per_diem': [], 'site_bonus': []
-        })
+        log.error("Batch save error: %s", e)
+        return []
 
 def save_shift_to_db(shift_date, start_time, end_time, per_diem, site_bonus):
-    """Save shift to database"""
+    """Save shift to database, returns the new shift id or None on failure"""
+    ids = save_shifts_batch([(shift_date, start_time, end_time, per_diem, site_bonus)])
+    return ids[0] if ids else None
+
+def delete_shift_ids(shift_ids):
+    """Delete several shifts by ID in one statement, returns the number of rows deleted"""
+    shift_ids = list(shift_ids)
+    if not shift_ids:
+        return 0
     try:
-        conn = sqlite3.connect("timesheet.db")
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO shifts (date, start_time, end_time, per_diem, site_bonus) 
-            VALUES (?, ?, ?, ?, ?)
-        """, (str(shift_date), start_time, end_time, per_diem, 1 if site_bonus else 0))
-        conn.commit()
-        conn.close()
-        return True
+        placeholders = ", ".join("?" * len(shift_ids))
+        conn = get_write_conn()
+        with _DB_LOCK:
+            cursor = conn.execute(f"DELETE FROM shifts WHERE id IN ({placeholders})", shift_ids)
+            _invalidate_shifts_cache()
+            affected_rows = cursor.rowcount
+        return affected_rows
     except Exception as e:
-        print(f"Save error: {e}")
-        return False
+        log.error("Delete error: %s", e)
+        return 0
 
 def delete_shift_from_db(shift_id):
     """Delete a shift from the database by ID"""
-    try:
-        conn = sqlite3.connect("timesheet.db")
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM shifts WHERE id = ?", (shift_id,))
-        conn.commit()
-        affected_rows = cursor.rowcount
-        conn.close()
-        return affected_rows > 0
-    except Exception as e:
-        print(f"Delete error: {e}")
-        return False
+    return delete_shift_ids([shift_id]) > 0
 
 def delete_all_shifts():
     """Delete all shifts from database"""
     try:
-        conn = sqlite3.connect("timesheet.db")
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM shifts")
-        conn.commit()
-        affected_rows = cursor.rowcount
-        conn.close()
+        conn = get_write_conn()
+        with _DB_LOCK:
+            cursor = conn.execute("DELETE FROM shifts")
+            _invalidate_shifts_cache()
+            affected_rows = cursor.rowcount
         return affected_rows
     except Exception as e:
-        print(f"Delete all error: {e}")
+        log.error("Delete all error: %s", e)
         return 0
     
 def bulk_add_shifts(state):
@@ -188,14 +505,25 @@ def bulk_add_shifts(state):
         state.bulk_shift_message = "❌ End date must be after start date"
         notify(state, "error", state.bulk_shift_message)
         return
-    count = 0
-    curr = state.bulk_start_date
-    while curr <= state.bulk_end_date:
-        if save_shift_to_db(curr, state.start_time.strip(), state.end_time.strip(), state.per_diem, state.site_bonus):
-            count += 1
-        curr += timedelta(days=1)
+    try:
+        start, end = normalize_shift_times(state.start_time, state.end_time)
+    except ValueError:
+        state.bulk_shift_message = INVALID_TIME_MESSAGE
+        notify(state, "error", "Invalid time")
+        return
+    per_diem, site_bonus = state.per_diem, state.site_bonus
+    # Day numbers are what shifts.date stores, so the range needs no date objects at all
+    first_day = _as_date(state.bulk_start_date).toordinal()
+    last_day = _as_date(state.bulk_end_date).toordinal()
+    rows = [(day, start, end, per_diem, site_bonus) for day in range(first_day, last_day + 1)]
+    # One executemany in one transaction instead of a commit per day
+    count = len(save_shifts_batch(rows))
+    if not count:
+        state.bulk_shift_message = "❌ Bulk add failed, no shifts were saved"
+        notify(state, "error", state.bulk_shift_message)
+        return
     state.saved_shifts = get_saved_shifts()
-    update_pay_calculations(state)
+    update_pay_calculations(state, affected_range=(date.fromordinal(first_day), date.fromordinal(last_day)))
     state.bulk_shift_message = f"✅ Bulk added {count} shifts from {state.bulk_start_date} to {state.bulk_end_date}"
     notify(state, "success", state.bulk_shift_message)
 
@@ -228,7 +556,10 @@ def calc_pay_period(week1_hours, week2_hours, week1_per_diem, week2_per_diem,
             ot_pay = ot_hours * (0.5 * regular_rate)
         
         taxable_gross = base_pay + site_bonus + ot_pay
-        per_diem_total = sum(PER_DIEM_RATES.get(choice, 0) for choice in per_diem_choices)
+        rate = PER_DIEM_RATES.get  # bound once instead of an attribute lookup per shift
+        per_diem_total = 0
+        for choice in per_diem_choices:
+            per_diem_total += rate(choice, 0)
         
         return taxable_gross, per_diem_total, ot_pay
     
@@ -247,119 +578,119 @@ def calc_pay_period(week1_hours, week2_hours, week1_per_diem, week2_per_diem,
     taxes = total_taxable_gross * tax_rate
     after_tax = total_taxable_gross - taxes + total_per_diem
     
-    print(f"CORRECTED BIWEEKLY PAY CALCULATION:")
-    print(f"  Week 1: {week1_hours} hrs, OT: ${w1_ot:.2f}")
-    print(f"  Week 2: {week2_hours} hrs, OT: ${w2_ot:.2f}")
-    print(f"  Total Overtime: ${total_ot:.2f}")
-    print(f"  Total Taxable Gross: ${total_taxable_gross:.2f}")
-    print(f"  Total Per Diem: ${total_per_diem:.2f}")
-    print(f"  After Tax: ${after_tax:.2f}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("CORRECTED BIWEEKLY PAY CALCULATION:")
+        log.debug(f"  Week 1: {week1_hours} hrs, OT: ${w1_ot:.2f}")
+        log.debug(f"  Week 2: {week2_hours} hrs, OT: ${w2_ot:.2f}")
+        log.debug(f"  Total Overtime: ${total_ot:.2f}")
+        log.debug(f"  Total Taxable Gross: ${total_taxable_gross:.2f}")
+        log.debug(f"  Total Per Diem: ${total_per_diem:.2f}")
+        log.debug(f"  After Tax: ${after_tax:.2f}")
     
     return total_taxable_gross, total_per_diem, after_tax
 
 
 def calculate_hours_from_timesheet(start_time, end_time):
     """Calculate hours worked from start and end time"""
+    # Plain integer minutes; no datetime objects on this path
     try:
-        start_dt = datetime.strptime(start_time, "%H:%M")
-        end_dt = datetime.strptime(end_time, "%H:%M")
-        
-        if end_dt <= start_dt:
-            end_dt += timedelta(days=1)
-        
-        duration = end_dt - start_dt
-        return duration.total_seconds() / 3600
-    except:
+        minutes = parse_minutes(end_time) - parse_minutes(start_time)
+    except (ValueError, TypeError):
         return 0
+    
+    if minutes <= 0:
+        minutes += 24 * 60
+    return minutes / 60
+
+# Per-week totals for one pay period; dates are day numbers so (date - start) / 7 is the week index.
+# Within a week, groups come most recently used first (the SAVED_SHIFTS_SQL order of each
+# code's newest shift), so ties in the projections' most_common() go to the latest choice.
+PERIOD_WEEKS_SQL = f"""
+    SELECT (date - :start) / 7 AS week,
+           meal_mask & {PER_DIEM_MASK} AS per_diem_code,
+           COUNT(*) AS days,
+           SUM(CASE WHEN end_time > start_time THEN end_time - start_time
+                    ELSE end_time - start_time + 1440 END) AS minutes,
+           SUM((meal_mask & {SITE_BONUS_BIT}) != 0) AS site_bonus_days,
+           MAX(printf('%07d %s %010d', date, COALESCE(created_at, ''), id)) AS last_used
+    FROM shifts
+    WHERE date BETWEEN :start AND :end
+    GROUP BY week, per_diem_code
+    ORDER BY week, last_used DESC
+"""
+
+# Shared base for periods without shifts; tuples keep it safe to share since nothing mutates them
+_EMPTY_PERIOD = {
+    'week1_hours': 0, 'week2_hours': 0,
+    'week1_per_diem': (), 'week2_per_diem': (),
+    'week1_site_bonus_days': 0, 'week2_site_bonus_days': 0,
+    'hours': 0,
+    'days': 0,
+    'site_bonus_days': 0
+}
 
-def analyze_timesheet_by_periods():
-    """Analyze timesheet data by defined pay periods with weekly overtime calculation"""
+def _empty_period(period_label):
+    """Period summary with no shifts"""
+    return {**_EMPTY_PERIOD, 'period_label': period_label}
+
+def analyze_timesheet_by_periods(df):
+    """Analyze timesheet data by defined pay periods with weekly overtime calculation
+    
+    df is the already loaded saved shifts table; period totals are summed in SQL.
+    """
     try:
-        conn = sqlite3.connect("timesheet.db")
-        
-        query = """
-            SELECT date, start_time, end_time, per_diem, site_bonus, created_at
-            FROM shifts 
-            ORDER BY date DESC, created_at DESC
-        """
+        conn = get_read_conn()
         
-        df = pd.read_sql_query(query, conn)
-        conn.close()
+        recent_shifts = df.head(10)
+        total_shifts = len(df)
         
-        if df.empty:
+        if total_shifts == 0:
             return {
-                'current_period': {
-                    'week1_hours': 0, 'week2_hours': 0,
-                    'week1_per_diem': [], 'week2_per_diem': [],
-                    'week1_site_bonus_days': 0, 'week2_site_bonus_days': 0,
-                    'period_label': 'No data'
-                },
-                'previous_period': {
-                    'week1_hours': 0, 'week2_hours': 0,
-                    'week1_per_diem': [], 'week2_per_diem': [],
-                    'week1_site_bonus_days': 0, 'week2_site_bonus_days': 0,
-                    'period_label': 'No data'
-                },
-                'recent_shifts': df,
+                'current_period': _empty_period('No data'),
+                'previous_period': _empty_period('No data'),
+                'recent_shifts': recent_shifts,
                 'total_shifts': 0
             }
         
-        df['date'] = pd.to_datetime(df['date'])
-        df['hours'] = df.apply(lambda row: calculate_hours_from_timesheet(
-            row['start_time'], row['end_time']), axis=1)
-        
         current_period_info, previous_period_info = get_current_and_previous_periods()
         
-        current_start = pd.to_datetime(current_period_info["start"])
-        current_end = pd.to_datetime(current_period_info["end"])
-        current_period_data = df[(df['date'] >= current_start) & (df['date'] <= current_end)]
-        
-        previous_start = pd.to_datetime(previous_period_info["start"])
-        previous_end = pd.to_datetime(previous_period_info["end"])
-        previous_period_data = df[(df['date'] >= previous_start) & (df['date'] <= previous_end)]
-        
-        def analyze_period_weekly(period_df, period_start_str, period_label):
+        def analyze_period_weekly(period_info):
             """Split biweekly period into two weeks for FLSA compliance"""
-            if period_df.empty:
-                return {
-                    'week1_hours': 0, 'week2_hours': 0,
-                    'week1_per_diem': [], 'week2_per_diem': [],
-                    'week1_site_bonus_days': 0, 'week2_site_bonus_days': 0,
-                    'period_label': period_label,
-                    'hours': 0,
-                    'days': 0,
-                    'site_bonus_days': 0
-                }
+            period_start = period_info["start"]
+            period_label = period_info["label"]
+            
+            # SQLite sums each 7-day week of the period with an index range seek;
+            # rows are split by per diem code so the per diem lists can be rebuilt
+            rows = conn.execute(PERIOD_WEEKS_SQL, {
+                "start": period_start.toordinal(),
+                "end": period_info["end"].toordinal()
+            }).fetchall()
+            
+            if not rows:
+                return _empty_period(period_label)
             
             # Split the 14-day biweekly period into two 7-day weeks
-            period_start = pd.to_datetime(period_start_str)
-            week1_end = period_start + timedelta(days=6)  # Days 0-6 (7 days)
             week1_start = period_start
+            week1_end = period_start + timedelta(days=6)  # Days 0-6 (7 days)
             week2_start = period_start + timedelta(days=7)  # Days 7-13 (7 days)
             
-            # Filter data for each week
-            week1_data = period_df[
-                (period_df['date'] >= week1_start) & 
-                (period_df['date'] <= week1_end)
-            ]
-            
-            week2_data = period_df[
-                (period_df['date'] >= week2_start)
-            ]
+            minutes = [0, 0]
+            per_diem_lists = [[], []]
+            site_bonus_days = [0, 0]
+            for week, per_diem_code, days, week_minutes, bonus_days, _ in rows:
+                minutes[week] += week_minutes
+                per_diem_lists[week].extend([PER_DIEM_OPTIONS[per_diem_code]] * days)
+                site_bonus_days[week] += bonus_days
             
             # Calculate weekly totals
-            week1_hours = week1_data['hours'].sum() if not week1_data.empty else 0
-            week2_hours = week2_data['hours'].sum() if not week2_data.empty else 0
-            
-            week1_per_diem = week1_data['per_diem'].tolist() if not week1_data.empty else []
-            week2_per_diem = week2_data['per_diem'].tolist() if not week2_data.empty else []
-            
-            week1_site_bonus_days = (week1_data['site_bonus'] == 1).sum() if not week1_data.empty else 0
-            week2_site_bonus_days = (week2_data['site_bonus'] == 1).sum() if not week2_data.empty else 0
+            week1_hours, week2_hours = minutes[0] / 60, minutes[1] / 60
+            week1_per_diem, week2_per_diem = per_diem_lists
+            week1_site_bonus_days, week2_site_bonus_days = site_bonus_days
             
-            print(f"Period Analysis: {period_label}")
-            print(f"  Week 1 ({week1_start.strftime('%m/%d')} - {week1_end.strftime('%m/%d')}): {week1_hours:.1f} hrs, {len(week1_data)} days, {week1_site_bonus_days} bonus days")
-            print(f"  Week 2 ({week2_start.strftime('%m/%d')} onwards): {week2_hours:.1f} hrs, {len(week2_data)} days, {week2_site_bonus_days} bonus days")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"Period Analysis: {period_label}")
+                log.debug(f"  Week 1 ({week1_start.strftime('%m/%d')} - {week1_end.strftime('%m/%d')}): {week1_hours:.1f} hrs, {len(week1_per_diem)} days, {week1_site_bonus_days} bonus days")
+                log.debug(f"  Week 2 ({week2_start.strftime('%m/%d')} onwards): {week2_hours:.1f} hrs, {len(week2_per_diem)} days, {week2_site_bonus_days} bonus days")
             
             return {
                 'week1_hours': week1_hours,
@@ -371,40 +702,22 @@ def analyze_timesheet_by_periods():
                 'period_label': period_label,
                 # Keep legacy fields for compatibility
                 'hours': week1_hours + week2_hours,
-                'days': len(period_df),
+                'days': len(week1_per_diem) + len(week2_per_diem),
                 'site_bonus_days': week1_site_bonus_days + week2_site_bonus_days
             }
         
         return {
-            'current_period': analyze_period_weekly(
-                current_period_data, 
-                current_period_info["start"], 
-                current_period_info["label"]
-            ),
-            'previous_period': analyze_period_weekly(
-                previous_period_data, 
-                previous_period_info["start"], 
-                previous_period_info["label"]
-            ),
-            'recent_shifts': df.head(10),
-            'total_shifts': len(df)
+            'current_period': analyze_period_weekly(current_period_info),
+            'previous_period': analyze_period_weekly(previous_period_info),
+            'recent_shifts': recent_shifts,
+            'total_shifts': total_shifts
         }
         
     except Exception as e:
-        print(f"Error analyzing timesheet: {e}")
+        log.error("Error analyzing timesheet: %s", e)
         return {
-            'current_period': {
-                'week1_hours': 0, 'week2_hours': 0,
-                'week1_per_diem': [], 'week2_per_diem': [],
-                'week1_site_bonus_days': 0, 'week2_site_bonus_days': 0,
-                'period_label': 'Error'
-            },
-            'previous_period': {
-                'week1_hours': 0, 'week2_hours': 0,
-                'week1_per_diem': [], 'week2_per_diem': [],
-                'week1_site_bonus_days': 0, 'week2_site_bonus_days': 0,
-                'period_label': 'Error'
-            },
+            'current_period': _empty_period('Error'),
+            'previous_period': _empty_period('Error'),
             'recent_shifts': pd.DataFrame(),
             'total_shifts': 0
         }
@@ -442,9 +755,6 @@ def calculate_monthly_projections(current_data, base_weekly, site_bonus_day, tax
         total_hours = avg_hours_per_day * days_per_month
         total_site_bonus_days = int(site_bonus_rate * days_per_month)
         
-        # Create per diem list for the month
-        per_diem_choices = [most_common_per_diem] * days_per_month
-        
         # FIXED: Calculate as biweekly periods per month (30 days / 14 day periods = ~2.14)
         biweekly_periods_in_month = days_per_month / 14
         
@@ -462,7 +772,8 @@ def calculate_monthly_projections(current_data, base_weekly, site_bonus_day, tax
             ot_pay = ot_hours * (0.5 * regular_rate)
         
         taxable_gross = monthly_base + site_bonus_total + ot_pay
-        per_diem_total = sum(PER_DIEM_RATES.get(choice, 0) for choice in per_diem_choices)
+        # Every projected day uses the same per diem choice
+        per_diem_total = PER_DIEM_RATES.get(most_common_per_diem, 0) * days_per_month
         
         taxes = taxable_gross * (tax_rate / 100)
         monthly_take_home = taxable_gross - taxes + per_diem_total
@@ -484,13 +795,7 @@ site_bonus = False
 message = "Ready to enter shift data"
 delete_shift_id = ""
 
-PER_DIEM_OPTIONS = ["None", "Breakfast Only", "Breakfast + Lunch", 
-                    "Breakfast + Lunch + Dinner", "Lunch + Dinner", "Dinner Only"]
-
-saved_shifts = pd.DataFrame({
-    'id': [], 'date': [], 'start_time': [], 'end_time': [], 
-    'per_diem': [], 'site_bonus': []
-})
+saved_shifts = _EMPTY_SHIFTS.copy()
 
 # Calculator settings
 base_weekly = 700
@@ -501,48 +806,76 @@ tax_rate = 15
 current_period_summary = ""
 previous_period_summary = ""
 total_pay_summary = ""
+combined_pay = 0.0
 monthly_projections = pd.DataFrame()
 
 # ---- Functions ----
+def insert_saved_shift(saved_shifts, new_row):
+    """Insert a freshly saved shift into the cached table, keeping the date DESC order"""
+    # Newest created_at wins among equal dates, so the row goes before them
+    pos = int((saved_shifts['date'] > new_row['date']).sum())
+    return pd.concat([saved_shifts.iloc[:pos], pd.DataFrame([new_row]), saved_shifts.iloc[pos:]],
+                     ignore_index=True)
+
 def save_shift(state):
     """Save shift and auto-calculate pay"""
-    if save_shift_to_db(state.selected_day, state.start_time.strip(), 
-                       state.end_time.strip(), state.per_diem, state.site_bonus):
+    # Read each state field once; every access round-trips through Taipy
+    selected_day = state.selected_day
+    per_diem = state.per_diem
+    site_bonus = state.site_bonus
+    
+    try:
+        start, end = normalize_shift_times(state.start_time, state.end_time)
+    except ValueError:
+        state.message = INVALID_TIME_MESSAGE
+        notify(state, "error", "Invalid time")
+        return
+    
+    shift_id = save_shift_to_db(selected_day, start, end, per_diem, site_bonus)
+    if shift_id:
         
-        new_shifts = get_saved_shifts()
-        state.saved_shifts = new_shifts
+        state.saved_shifts = insert_saved_shift(state.saved_shifts, {
+            'id': shift_id,
+            'date': _as_date(selected_day).isoformat(),
+            'start_time': start,
+            'end_time': end,
+            'per_diem': per_diem,
+            'site_bonus': bool(site_bonus)
+        })
         
-        update_pay_calculations(state)
+        update_pay_calculations(state, affected_range=(selected_day, selected_day))
         
-        state.message = f"✅ Shift saved and pay updated for {state.selected_day}"
+        state.message = f"✅ Shift saved and pay updated for {selected_day}"
         notify(state, "success", "Shift saved and pay calculated!")
     else:
         state.message = "❌ Failed to save shift"
         notify(state, "error", "Database save failed")
 
 def delete_selected_shift(state):
-    """Delete a specific shift by ID"""
-    if not state.delete_shift_id.strip():
+    """Delete one or more shifts by ID (comma or space separated)"""
+    try:
+        shift_ids = [int(part) for part in state.delete_shift_id.replace(",", " ").split()]
+    except ValueError:
+        state.message = "❌ Please enter valid numeric Shift IDs"
+        notify(state, "error", "Invalid shift ID")
+        return
+    
+    if not shift_ids:
         state.message = "❌ Please enter a Shift ID to delete"
         notify(state, "warning", "No shift ID provided")
         return
     
-    try:
-        shift_id = int(state.delete_shift_id.strip())
-        if delete_shift_from_db(shift_id):
-            new_shifts = get_saved_shifts()
-            state.saved_shifts = new_shifts
-            update_pay_calculations(state)
-            
-            state.message = f"✅ Shift ID {shift_id} deleted successfully"
-            state.delete_shift_id = ""
-            notify(state, "success", f"Shift {shift_id} deleted!")
-        else:
-            state.message = f"❌ Shift ID {shift_id} not found"
-            notify(state, "error", f"Shift {shift_id} not found")
-    except ValueError:
-        state.message = "❌ Please enter a valid numeric Shift ID"
-        notify(state, "error", "Invalid shift ID")
+    deleted_count = delete_shift_ids(shift_ids)
+    if deleted_count:
+        state.saved_shifts = get_saved_shifts()
+        update_pay_calculations(state)
+        
+        state.message = f"✅ Deleted {deleted_count} of {len(shift_ids)} shifts"
+        state.delete_shift_id = ""
+        notify(state, "success", f"{deleted_count} shifts deleted!")
+    else:
+        state.message = "❌ Shift ID not found"
+        notify(state, "error", "Shift not found")
 
 def clear_all_shifts(state):
     """Delete all shifts after confirmation"""
@@ -558,11 +891,33 @@ def clear_all_shifts(state):
         state.message = "❌ No shifts to delete"
         notify(state, "info", "No shifts found")
 
-def update_pay_calculations(state):
-    """Update pay calculations based on defined pay periods"""
-    print(f"UPDATING CALCULATIONS with Base Weekly: ${state.base_weekly}, Site Bonus: ${state.site_bonus_day}")
+def _total_pay_summary(total_shifts, combined):
+    """Markdown for the summary card"""
+    return f"""**Summary:**
+- Total Shifts Recorded: {total_shifts}
+- Last Two Periods Combined: ${combined:,.2f}"""
+
+def update_pay_calculations(state, *, affected_range=None):
+    """Update pay calculations based on defined pay periods
+    
+    affected_range is the (first, last) date span a write touched. When it lies outside the
+    previous and current periods the pay figures cannot change, so only the shift count is
+    refreshed. Keyword-only so Taipy's on_change arguments never land in it.
+    """
+    if affected_range is not None:
+        current_info, previous_info = get_current_and_previous_periods()
+        first, last = (_as_date(day) for day in affected_range)
+        if last < previous_info["start"] or first > current_info["end"]:
+            state.total_pay_summary = _total_pay_summary(len(state.saved_shifts), state.combined_pay)
+            return
     
-    data = analyze_timesheet_by_periods()
+    # Lazy %-formatting still reads the state attributes, so guard the call
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("UPDATING CALCULATIONS with Base Weekly: $%s, Site Bonus: $%s",
+                  state.base_weekly, state.site_bonus_day)
+    
+    # Write handlers refresh state.saved_shifts first, so reuse it instead of re-reading the table
+    data = analyze_timesheet_by_periods(state.saved_shifts)
     
     current = data['current_period']
     previous = data['previous_period']
@@ -599,9 +954,8 @@ def update_pay_calculations(state):
 - Per Diem Total: ${previous_per_diem_total:.2f}
 - Estimated Take-Home: ${previous_after:,.2f}"""
     
-    state.total_pay_summary = f"""**Summary:**
-- Total Shifts Recorded: {data['total_shifts']}
-- Last Two Periods Combined: ${current_after + previous_after:,.2f}"""
+    state.combined_pay = current_after + previous_after
+    state.total_pay_summary = _total_pay_summary(data['total_shifts'], state.combined_pay)
     
     # Update monthly projections using current period's week 1 data
     current_for_projection = {
@@ -618,7 +972,7 @@ def update_pay_calculations(state):
 
 def on_init(state):
     """Initialize app and calculate initial pay"""
-    print("Initializing app...")
+    log.debug("Initializing app...")
     
     initial_shifts = get_saved_shifts()
     state.saved_shifts = initial_shifts
@@ -626,7 +980,7 @@ def on_init(state):
     
     update_pay_calculations(state)
     
-    print("App initialized with biweekly pay period calculations")
+    log.debug("App initialized with biweekly pay period calculations")
 
 # ---- Multi-page UI ----
 timesheet_page = """
@@ -672,11 +1026,11 @@ Site Bonus: <|{site_bonus}|toggle|>
 
 ## Your Shifts
 
-<|{saved_shifts}|table|>
+<|{saved_shifts}|table|use_checkbox|>
 
 ## Delete Shifts
 
-Delete by Shift ID: <|{delete_shift_id}|input|> <|Delete Shift|button|on_action=delete_selected_shift|>
+Delete by Shift ID (separate several with commas): <|{delete_shift_id}|input|> <|Delete Shift|button|on_action=delete_selected_shift|>
 
 <|Clear All Shifts|button|on_action=clear_all_shifts|>
 """
@@ -728,9 +1082,6 @@ pages = {
 }
 
 # ---- Main execution ----
-import os
-from taipy.gui import Gui
-
 if __name__ == "__main__":
     print("Starting Biweekly Timesheet Calculator...")
     print("Pay periods: Aug 10-23, Aug 24-Sep 6, etc. (14-day biweekly)")
@@ -749,6 +1100,6 @@ if __name__ == "__main__":
         host="0.0.0.0",  # expose externally
         port=port,
         title="Biweekly Timesheet Calculator",
-        debug=False,
+        debug=bool(os.environ.get("TIMESHEET_DEBUG")),
         on_init=on_init
     )